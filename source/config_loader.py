@@ -1,5 +1,6 @@
 # ====== Standard Library Imports ======
 from dotenv import load_dotenv
+from functools import lru_cache
 from typing import Any
 import pathlib
 import sys
@@ -7,6 +8,7 @@ import os
 
 # ====== Third-Party Library Imports ======
 from loggerplusplus import loggerplusplus
+import loggerplusplus as lpp_module
 from loggerplusplus import formats as lpp_formats
 
 load_dotenv()
@@ -30,6 +32,8 @@ class CONFIG:
     ROOT_DIR = pathlib.Path(__file__).resolve().parent
     TOOLS_DIR = ROOT_DIR / "libs"
     FRONTEND_DIR = TOOLS_DIR / env("FRONTEND_DIR")
+    # Disable when a reverse proxy (nginx, caddy...) serves FRONTEND_DIR directly
+    SERVE_FRONTEND = env("SERVE_FRONTEND", default=True, cast=bool)
 
     DATA_DIR = os.path.join(
         "/",  # Data dir is at root of the container
@@ -61,26 +65,42 @@ class CONFIG:
 
 
 # ────── Apply logger config ──────
-loggerplusplus.remove()  # avoid double logging
-lpp_format = lpp_formats.ShortFormat(identifier_width=15)
-
-if CONFIG.ENABLE_CONSOLE:
-    loggerplusplus.add(
-        sink=sys.stdout,
-        level=CONFIG.CONSOLE_LEVEL,
-        format=lpp_format,
-    )
-
-if CONFIG.ENABLE_FILE:
-    loggerplusplus.add(
-        pathlib.Path("logs"),
-        level=CONFIG.FILE_LEVEL,
-        format=lpp_format,
-        rotation="1 week",  # "100 MB" / "00:00"
-        retention="30 days",
-        compression="zip",
-        encoding="utf-8",
-        enqueue=True,
-        backtrace=True,
-        diagnose=False,
-    )
+def _setup_logger() -> None:
+    """Install the console / file sinks described by CONFIG (once per process)."""
+    # Sentinel kept on the loggerplusplus module (the proxy object has __slots__),
+    # so it survives an importlib.reload() of this module
+    if getattr(lpp_module, "_configured", False):
+        return
+
+    loggerplusplus.remove()  # avoid double logging
+    lpp_format = lpp_formats.ShortFormat(identifier_width=15)
+
+    if CONFIG.ENABLE_CONSOLE:
+        loggerplusplus.add(
+            sink=sys.stdout,
+            level=CONFIG.CONSOLE_LEVEL,
+            format=lpp_format,
+        )
+
+    if CONFIG.ENABLE_FILE:
+        loggerplusplus.add(
+            pathlib.Path("logs"),
+            level=CONFIG.FILE_LEVEL,
+            format=lpp_format,
+            rotation="1 week",  # "100 MB" / "00:00"
+            retention="30 days",
+            compression="zip",
+            encoding="utf-8",
+            enqueue=True,
+            backtrace=False,  # no extended stack capture on hot error paths
+            diagnose=False,
+        )
+
+    lpp_module._configured = True
+
+
+@lru_cache(maxsize=1)
+def get_config() -> type[CONFIG]:
+    """Return CONFIG, setting up the logger on the first call only."""
+    _setup_logger()
+    return CONFIG
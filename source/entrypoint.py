@@ -9,17 +9,13 @@ from fastapi import FastAPI
 from typing import cast
 
 # ====== Internal Project Imports ======
-from config_loader import CONFIG
+from config_loader import get_config
 
 # Background & api context
 from backend.app import create_app
 from backend.context import CONTEXT
 
-# Services
-from backend.services.model_parameters_computer import ModelParamsComputer
-from backend.services.electricitymaps_client import ElectricityMapsAPI
-from backend.services.prompt_computer import PromptComputer
-from backend.services.watsonx_client import WatsonClient
+CONFIG = get_config()
 
 
 # =======================
@@ -39,39 +35,29 @@ def _build_app() -> FastAPI:
     """
 
     # Create app context -> inject shared instance to the global shared context
+    # (services are built in the app lifespan, see backend.lifespan)
     CONTEXT.logger = LoggerPlusPlus(
         core=loggerplusplus.bind(identifier="main")
     )
-    CONTEXT.model_params_computer = ModelParamsComputer(
-        json_path=CONFIG.MODELS_PATH
-    )
-    CONTEXT.electricity_maps_api = ElectricityMapsAPI(
-        token=CONFIG.ELECTRICITY_MAPS_API_TOKEN
-    )
-    CONTEXT.prompt_computer = PromptComputer()
-    CONTEXT.watsonx_api = WatsonClient(
-        api_key=CONFIG.WATSONX_API_TOKEN,
-        deployment_id=CONFIG.WATSONX_DEPLOYMENT_ID,
-        region=CONFIG.WATSONX_REGION
-    )
 
     # Create the FastAPI application
     fastapi_app = create_app()
 
-    # Mount the static front-end at the root URL
-    fastapi_app.mount(
-        "/",  # URL root
-        StaticFiles(directory=CONFIG.FRONTEND_DIR, html=True),
-        name="static",
-    )
+    # Mount the static front-end at the root URL (unless served by a reverse proxy)
+    if CONFIG.SERVE_FRONTEND:
+        fastapi_app.mount(
+            "/",  # URL root
+            StaticFiles(directory=CONFIG.FRONTEND_DIR, html=True),
+            name="static",
+        )
 
     # CORS for the hub at http://localhost:{CONFIG.AGGREGATOR_UI_PORT}
     fastapi_app.add_middleware(
         cast(type[ASGIApp], CORSMiddleware),
         allow_origins=[f"http://localhost:{CONFIG.PORT}"],
         allow_credentials=False,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=("GET", "POST"),  # only verbs exposed by the routers
+        allow_headers=("content-type",),  # JSON bodies from the frontend
     )
 
     return fastapi_app
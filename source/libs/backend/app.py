@@ -1,4 +1,5 @@
 # ====== Third-party Library Imports ======
+from fastapi.responses import ORJSONResponse
 from fastapi import FastAPI
 
 # ====== Local Project Imports ======
@@ -15,7 +16,8 @@ from .routes import (
 def create_app():
     app = FastAPI(
         title="App",
-        lifespan=lifespan()
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
     )
 
     # Include API routers with '/api' prefix for organized endpoint grouping.
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 
 # ====== Third-party Library Imports ======
 from loggerplusplus import LoggerPlusPlus
+import httpx
 
 # ====== Internal Project Imports ======
 from .services.model_parameters_computer import ModelParamsComputer
@@ -13,7 +14,12 @@ from .services.watsonx_client import WatsonClient
 
 @dataclass(slots=True)
 class CONTEXT:
+    """
+    Single process-wide context, used at class level (never instantiated).
+    `logger` is set by the entrypoint, every other field by the app lifespan.
+    """
     logger: LoggerPlusPlus
+    http_client: httpx.AsyncClient
     model_params_computer: ModelParamsComputer
     electricity_maps_api: ElectricityMapsAPI
     prompt_computer: PromptComputer
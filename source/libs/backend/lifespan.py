@@ -1,28 +1,57 @@
 # ====== Standard Library Imports ======
 from contextlib import asynccontextmanager
 
+# ====== Third-party Library Imports ======
+import httpx
+
+# ====== Internal Project Imports ======
+from config_loader import get_config
+
 # ====== Local Project Imports ======
+from .services.model_parameters_computer import ModelParamsComputer
+from .services.electricitymaps_client import ElectricityMapsAPI
+from .services.prompt_computer import PromptComputer
+from .services.watsonx_client import WatsonClient
 from .context import CONTEXT
 
+CONFIG = get_config()
 
-def lifespan():
+
+@asynccontextmanager
+async def lifespan(app):
     """
+    Async context manager for FastAPI lifespan.
+
+    Args:
+        app: The FastAPI application instance.
     """
+    # Build the shared services once, at startup rather than at import
+    CONTEXT.model_params_computer = ModelParamsComputer(
+        json_path=CONFIG.MODELS_PATH
+    )
+    CONTEXT.prompt_computer = PromptComputer()
+    CONTEXT.watsonx_api = WatsonClient.get_instance(
+        api_key=CONFIG.WATSONX_API_TOKEN,
+        deployment_id=CONFIG.WATSONX_DEPLOYMENT_ID,
+        region=CONFIG.WATSONX_REGION
+    )
 
-    @asynccontextmanager
-    async def _lifespan(app):
-        """
-        Async context manager for FastAPI lifespan.
-
-        Args:
-            app: The FastAPI application instance.
-        """
-        try:
-            # Log and start the bot when the app starts.
-            CONTEXT.logger.info("Application start up !")
-            yield
-        finally:
-            # Log and shut down the bot gracefully when the app stops.
-            CONTEXT.logger.info("Application shutting down...")
-
-    return _lifespan
+    # Shared HTTP connection pool, reused by every outbound API call
+    CONTEXT.http_client = httpx.AsyncClient(
+        timeout=5,
+        limits=httpx.Limits(max_keepalive_connections=32),
+    )
+    CONTEXT.electricity_maps_api = ElectricityMapsAPI(
+        token=CONFIG.ELECTRICITY_MAPS_API_TOKEN,
+        client=CONTEXT.http_client,
+    )
+    try:
+        # Log and start the bot when the app starts.
+        CONTEXT.logger.info("Application start up !")
+        yield
+    finally:
+        # Log and shut down the bot gracefully when the app stops.
+        CONTEXT.logger.info("Application shutting down...")
+        await CONTEXT.http_client.aclose()
+        CONTEXT.watsonx_api.close()
+        await CONTEXT.watsonx_api.aclose()
@@ -1,19 +1,22 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 
 class UserInput(BaseModel):
     prompt: str
     model: str
     device_type: str
-    location: str
+    location: tuple[float, float]  # (lat, lon), sent by the frontend as "lat, lon"
     has_gpu: bool
 
+    @field_validator("location", mode="before")
+    @classmethod
+    def _parse_location(cls, value):
+        """Split the "lat, lon" string once at validation time (bad input -> 422)."""
+        if isinstance(value, str):
+            return tuple(part.strip() for part in value.split(","))
+        return value
 
-class EnterpriseInput(BaseModel):
-    prompt: str
-    model: str
-    device_type: str
-    location: str
-    has_gpu: bool
+
+class EnterpriseInput(UserInput):
     queries_per_user_per_day: int
-    number_of_employees: int
\ No newline at end of file
+    number_of_employees: int
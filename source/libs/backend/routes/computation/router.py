@@ -1,6 +1,8 @@
 # ====== Standard Library Imports ======
+import asyncio
 
 # ====== Third-party Library Imports ======
+from cachetools import LRUCache
 from fastapi import APIRouter
 import numpy as np
 
@@ -12,6 +14,52 @@ from .model import UserInput, EnterpriseInput
 # ====== Router Definition ======
 router = APIRouter()
 
+# ====== Constants ======
+# Smooth, low-dispersion monthly seasonality (normalized to sum to 1)
+_MONTHLY_WEIGHTS = np.array(
+    [0.92, 0.96, 1.00, 1.04, 1.08, 1.10, 0.98, 0.88, 1.04, 1.06, 1.00, 0.94],
+    dtype=np.float64
+)
+_MONTHLY_WEIGHTS /= _MONTHLY_WEIGHTS.sum()
+_MONTHLY_WEIGHTS.flags.writeable = False
+
+# Equivalents conversion factors, pre-inverted so each equivalent is one multiply
+_PHONE_CHARGES_PER_KWH = 1000.0 / 15.0  # ~15 Wh per phone full charge
+_LED_HOURS_PER_KWH = 1000.0 / 10.0  # 10 W LED -> Wh/10 = hours
+_KM_CAR_PER_GCO2 = 1.0 / 120.0  # 120 g CO2 per km
+_KM_CAR_PER_KGCO2 = 1000.0 / 120.0
+_TREES_PER_KGCO2 = 1.0 / 21.0  # 21 kg CO2 absorbed per tree/year
+
+# Process-wide random generator (PCG64) for the monthly noise
+_RNG = np.random.default_rng()
+
+# Memoized energy predictions, keyed on every input of the WatsonX model
+_PREDICT_CACHE: LRUCache = LRUCache(maxsize=4096)
+
+
+# ====== Private Helpers ======
+async def _predict_energy(
+        have_gpu: bool,
+        device: str,
+        nb_parameters: float,
+        indicators: dict[str, int | float]
+) -> float:
+    """
+    Predict the energy (kWh) of a single query, reusing previous predictions
+    made with identical inputs.
+    """
+    key = (have_gpu, device, nb_parameters, tuple(indicators.items()))
+    energy_kwh = _PREDICT_CACHE.get(key)
+    if energy_kwh is None:
+        energy_kwh = await CONTEXT.watsonx_api.predict_async(
+            have_gpu=have_gpu,
+            device=device,
+            nb_parameters=nb_parameters,
+            indicators=indicators
+        )
+        _PREDICT_CACHE[key] = energy_kwh
+    return energy_kwh
+
 
 @auto_handle_errors
 @router.post("/simulate_carbon_impact/")
@@ -25,26 +73,26 @@ async def simulate_carbon_impact(user_input: UserInput):
     """
     # Compute model parameters & prompt indicators
     parameters = CONTEXT.model_params_computer.get_params(user_input.model)
-    lat, lon = map(float, user_input.location.split(", "))
+    lat, lon = user_input.location
     prompt_indicators = CONTEXT.prompt_computer.compute(user_input.prompt)
 
     # Predict energy (kWh) and carbon (gCO2)
-    energy_kwh = CONTEXT.watsonx_api.predict(
-        have_gpu=user_input.has_gpu,
-        device=user_input.device_type,
-        nb_parameters=parameters,
-        indicators=prompt_indicators
-    )
-    energy_wh = energy_kwh * 1000.0
-
-    carbon_gco2 = CONTEXT.electricity_maps_api.estimate_impact(
-        lat=lat, lon=lon, kwh=energy_kwh
+    # (the energy prediction and the carbon intensity lookup run concurrently)
+    energy_kwh, carbon_intensity = await asyncio.gather(
+        _predict_energy(
+            have_gpu=user_input.has_gpu,
+            device=user_input.device_type,
+            nb_parameters=parameters,
+            indicators=prompt_indicators
+        ),
+        CONTEXT.electricity_maps_api.get_carbon_intensity(lat, lon)
     )
+    carbon_gco2 = CONTEXT.electricity_maps_api.compute_impact(carbon_intensity, energy_kwh)
 
     # Equivalents (personal)
-    phone_charges = energy_wh / 15.0  # ~15 Wh per phone full charge
-    km_car = (carbon_gco2 / 120.0)        # 120 g CO2 per km
-    led_hours = energy_wh / 10.0  # 10 W LED -> Wh/10 = hours
+    phone_charges = energy_kwh * _PHONE_CHARGES_PER_KWH
+    km_car = carbon_gco2 * _KM_CAR_PER_GCO2
+    led_hours = energy_kwh * _LED_HOURS_PER_KWH
 
     result = {
         "energy_kwh": round(energy_kwh, 6),
@@ -73,20 +121,21 @@ async def simulate_enterprise_impact(enterprise_input: EnterpriseInput):
     """
     # Single query computation context
     parameters = CONTEXT.model_params_computer.get_params(enterprise_input.model)
-    lat, lon = map(float, enterprise_input.location.split(", "))
+    lat, lon = enterprise_input.location
     prompt_indicators = CONTEXT.prompt_computer.compute(enterprise_input.prompt)
 
     # Predict single-query energy (kWh) and carbon (gCO2)
-    energy_kwh = CONTEXT.watsonx_api.predict(
-        have_gpu=enterprise_input.has_gpu,
-        device=enterprise_input.device_type,
-        nb_parameters=parameters,
-        indicators=prompt_indicators
-    )
-
-    carbon_gco2 = CONTEXT.electricity_maps_api.estimate_impact(
-        lat=lat, lon=lon, kwh=energy_kwh
+    # (the energy prediction and the carbon intensity lookup run concurrently)
+    energy_kwh, carbon_intensity = await asyncio.gather(
+        _predict_energy(
+            have_gpu=enterprise_input.has_gpu,
+            device=enterprise_input.device_type,
+            nb_parameters=parameters,
+            indicators=prompt_indicators
+        ),
+        CONTEXT.electricity_maps_api.get_carbon_intensity(lat, lon)
     )
+    carbon_gco2 = CONTEXT.electricity_maps_api.compute_impact(carbon_intensity, energy_kwh)
 
     # Yearly totals
     daily_queries = enterprise_input.queries_per_user_per_day
@@ -99,41 +148,39 @@ async def simulate_enterprise_impact(enterprise_input: EnterpriseInput):
     total_carbon_tons = total_carbon_kg / 1000.0
 
     # Monthly breakdown with smooth, low-dispersion seasonality
-    monthly_data = []
-    weights = np.array([0.92, 0.96, 1.00, 1.04, 1.08, 1.10, 0.98, 0.88, 1.04, 1.06, 1.00, 0.94], dtype=float)
-    weights = weights / weights.sum()
-
-    expected = total_queries_year * weights
-    noise = np.clip(np.random.normal(1.0, 0.03, 12), 0.90, 1.10)
+    expected = total_queries_year * _MONTHLY_WEIGHTS
+    noise = np.clip(_RNG.normal(1.0, 0.03, 12), 0.90, 1.10)
     noisy = expected * noise
     noisy *= (total_queries_year / noisy.sum())
 
     rounded = np.floor(noisy).astype(int)
     remainder = int(total_queries_year - rounded.sum())
     fractional_order = np.argsort(noisy - rounded)[::-1]
-    for i in range(abs(remainder)):
-        idx = fractional_order[i % 12]
-        rounded[idx] += 1 if remainder > 0 else -1
-        if rounded[idx] < 0:
-            rounded[idx] = 0
-
-    for month in range(1, 13):
-        q = int(rounded[month - 1])
-        monthly_energy = energy_kwh * q
-        monthly_carbon = (carbon_gco2 * q) / 1000.0  # kg
-        monthly_data.append({
-            "month": month,
-            "queries": q,
-            "energy_kwh": round(monthly_energy, 2),
-            "carbon_kg": round(monthly_carbon, 2)
-        })
+    # Spread the remainder over the months with the largest fractional parts
+    # (np.resize wraps around the 12 months if |remainder| ever exceeds 12)
+    np.add.at(rounded, np.resize(fractional_order, abs(remainder)), 1 if remainder > 0 else -1)
+    np.maximum(rounded, 0, out=rounded)
+
+    # Per-month energy (kWh) & carbon (kg) computed and rounded as one 2x12 block
+    monthly_queries = rounded.tolist()
+    monthly_energy, monthly_carbon = np.round(
+        np.outer((energy_kwh, carbon_gco2 / 1000.0), rounded), 2
+    ).tolist()
+    monthly_data = [
+        {
+            "month": month + 1,
+            "queries": monthly_queries[month],
+            "energy_kwh": monthly_energy[month],
+            "carbon_kg": monthly_carbon[month]
+        }
+        for month in range(12)
+    ]
 
     # Equivalents (enterprise, low-impact oriented)
-    energy_wh_total = total_energy_kwh * 1000.0
-    phone_charges_eq = energy_wh_total / 15.0  # 15 Wh per phone charge
-    led_hours_eq = energy_wh_total / 10.0  # 10 W LED -> Wh/10
-    km_car_eq = (total_carbon_kg * 1000.0) / 120.0  # 120 g CO2 / km
-    trees_needed = total_carbon_kg / 21.0  # 21 kg CO2 absorbed per tree/year
+    phone_charges_eq = total_energy_kwh * _PHONE_CHARGES_PER_KWH
+    led_hours_eq = total_energy_kwh * _LED_HOURS_PER_KWH
+    km_car_eq = total_carbon_kg * _KM_CAR_PER_KGCO2
+    trees_needed = total_carbon_kg * _TREES_PER_KGCO2
 
     result = {
         "single_query": {
@@ -1,6 +1,8 @@
-import requests
+import httpx
 from datetime import datetime, timezone
-import urllib.parse
+import threading
+import time
+from cachetools import TTLCache
 from loggerplusplus import LoggerClass
 
 
@@ -9,31 +11,63 @@ class ElectricityMapsAPI(LoggerClass):
 
     BASE_URL = "https://api.electricitymaps.com/v3/carbon-intensity/past"
 
-    def __init__(self, token: str, use_utc: bool = True):
+    CACHE_MAXSIZE = 1024
+    CACHE_TTL_SEC = 15 * 60  # l'intensité carbone évolue à l'échelle de l'heure
+
+    def __init__(self, token: str, client: httpx.AsyncClient, use_utc: bool = True):
         """
         Args:
             token (str): Clé d'API ElectricityMaps.
+            client (httpx.AsyncClient): Client HTTP partagé (pool de connexions de l'application).
             use_utc (bool): Si True, utilise l'heure UTC (par défaut).
         """
         LoggerClass.__init__(self)
         self.token = token
+        self.client = client
         self.use_utc = use_utc
 
+        # Cache (lat, lon, heure) -> intensité carbone, partagé entre les requêtes
+        self._cache: TTLCache = TTLCache(maxsize=self.CACHE_MAXSIZE, ttl=self.CACHE_TTL_SEC)
+        self._cache_lock = threading.Lock()
+
+        # Dernière chaîne datetime encodée pour l'API : (heure, chaîne)
+        self._datetime_cache: tuple[int, str] = (-1, "")
+
+    @staticmethod
+    def _current_hour() -> int:
+        """Heure courante, en nombre d'heures écoulées depuis l'epoch."""
+        return int(time.time()) // 3600
+
+    def _cache_key(self, lat: float, lon: float) -> tuple[float, float, int]:
+        """Clé de cache : coordonnées arrondies à 0.01° et heure courante tronquée."""
+        return round(lat, 2), round(lon, 2), self._current_hour()
+
     def _get_datetime_str(self) -> str:
-        """Construit la date/heure au format attendu par l’API."""
+        """
+        Construit la date/heure (tronquée à l'heure) au format attendu par l’API.
+        La chaîne encodée n'est recalculée qu'une fois par heure.
+        """
+        hour = self._current_hour()
+        cached_hour, encoded = self._datetime_cache
+        if cached_hour == hour:
+            return encoded
+
+        timestamp = hour * 3600
         if self.use_utc:
-            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            now = datetime.fromtimestamp(timestamp, timezone.utc)
         else:
-            now = datetime.now()
+            now = datetime.fromtimestamp(timestamp)
 
-        formatted = now.strftime("%Y-%m-%d+%H:%M")
-        encoded = urllib.parse.quote(formatted, safe='+')
-        self.logger.debug(f"🕒 Datetime pour API : {encoded}")
+        # "+" laissé tel quel et ":" pré-encodé en "%3A" (équivalent de quote(..., safe='+'))
+        encoded = now.strftime("%Y-%m-%d+%H%%3A%M")
+        self._datetime_cache = (hour, encoded)
+        self.logger.debug("🕒 Datetime pour API : {}", encoded)
         return encoded
 
-    def get_carbon_intensity(self, lat: float, lon: float) -> float | None:
+    async def get_carbon_intensity(self, lat: float, lon: float) -> float | None:
         """
         Récupère l'intensité carbone (gCO₂/kWh) pour une localisation donnée.
+        Les valeurs sont mises en cache par (lat, lon, heure) ; les erreurs ne le sont pas.
 
         Args:
             lat (float): Latitude.
@@ -42,30 +76,40 @@ class ElectricityMapsAPI(LoggerClass):
         Returns:
             float | None: L'intensité carbone en gCO₂/kWh ou None si erreur.
         """
+        key = self._cache_key(lat, lon)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            self.logger.debug("♻️ Intensité carbone en cache : {} gCO₂/kWh", cached)
+            return cached
+
         datetime_str = self._get_datetime_str()
         url = f"{self.BASE_URL}?datetime={datetime_str}&lat={lat}&lon={lon}"
         headers = {"auth-token": self.token}
 
-        self.logger.info(f"🌍 Appel API : {url}")
+        self.logger.info("🌍 Appel API : {}", url)
 
         try:
-            response = requests.get(url, headers=headers)
+            response = await self.client.get(url, headers=headers)
             response.raise_for_status()
             data = response.json()
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"❌ Erreur API : {e}")
+        except (httpx.HTTPError, ValueError) as e:
+            self.logger.error("❌ Erreur API : {}", e)
             return None
 
         carbon_intensity = data.get("carbonIntensity")
         if carbon_intensity is None:
             self.logger.warning("⚠️ Pas de valeur 'carbonIntensity' dans la réponse API.")
-            self.logger.debug(f"Réponse complète : {data}")
+            self.logger.debug("Réponse complète : {}", data)
             return None
 
-        self.logger.info(f"✅ Intensité carbone : {carbon_intensity} gCO₂/kWh")
+        with self._cache_lock:
+            self._cache[key] = carbon_intensity
+
+        self.logger.info("✅ Intensité carbone : {} gCO₂/kWh", carbon_intensity)
         return carbon_intensity
 
-    def estimate_impact(self, lat: float, lon: float, kwh: float) -> float | None:
+    async def estimate_impact(self, lat: float, lon: float, kwh: float) -> float | None:
         """
         Calcule l'impact carbone d'une consommation (en gCO₂).
 
@@ -77,12 +121,25 @@ class ElectricityMapsAPI(LoggerClass):
         Returns:
             float | None: Émission estimée (en grammes de CO₂).
         """
-        self.logger.debug(f"🔎 Calcul de l'impact carbone pour {kwh} kWh à {lat},{lon}")
-        carbon_intensity = self.get_carbon_intensity(lat, lon)
+        self.logger.debug("🔎 Calcul de l'impact carbone pour {} kWh à {},{}", kwh, lat, lon)
+        carbon_intensity = await self.get_carbon_intensity(lat, lon)
+        return self.compute_impact(carbon_intensity, kwh)
+
+    def compute_impact(self, carbon_intensity: float | None, kwh: float) -> float | None:
+        """
+        Calcule l'impact carbone à partir d'une intensité carbone déjà récupérée.
+
+        Args:
+            carbon_intensity (float | None): Intensité carbone (gCO₂/kWh).
+            kwh (float): Énergie consommée (en kWh).
+
+        Returns:
+            float | None: Émission estimée (en grammes de CO₂).
+        """
         if carbon_intensity is None:
             self.logger.warning("⚠️ Impossible de calculer l'impact carbone : intensité non disponible.")
             return None
 
         total = carbon_intensity * kwh
-        self.logger.info(f"💨 Impact estimé : {total:.2f} gCO₂ pour {kwh} kWh.")
+        self.logger.info("💨 Impact estimé : {:.2f} gCO₂ pour {} kWh.", total, kwh)
         return total
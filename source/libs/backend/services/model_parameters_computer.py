@@ -1,57 +1,74 @@
-import json
+import orjson
+from functools import lru_cache
 from pathlib import Path
 from loggerplusplus import LoggerClass
 
 
+@lru_cache(maxsize=128)
+def _normalize_key(key: str) -> str:
+    """Normalize model name or key for consistency (memoized: model names are a small bounded set)."""
+    return key.strip().lower().replace(" ", "").replace("-", "").replace("_", "")
+
+
 class ModelParamsComputer(LoggerClass):
     def __init__(self, json_path: str | Path):
         super().__init__()
         self.json_path = json_path
         self.models = {}
+        self._alias_lookup = {}
+        # Bound lookups, left to None while no model is loaded
+        self._get = None
+        self._get_normalized = None
         self._load_json()
 
-    def _normalize_key(self, key: str) -> str:
-        """Normalize model name or key for consistency."""
-        return key.strip().lower().replace(" ", "").replace("-", "").replace("_", "")
-
     def _load_json(self) -> None:
         """Load the JSON file containing model names and their parameters."""
         try:
-            with open(self.json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.raw_models = data.get("available_models", data)
+            data = orjson.loads(Path(self.json_path).read_bytes())
+            self.raw_models = data.get("available_models", data)
 
-                # Normalize keys for consistency
-                self.models = {
-                    self._normalize_key(k): v for k, v in self.raw_models.items()
-                }
+            # Normalize keys for consistency
+            self.models = {
+                _normalize_key(k): v for k, v in self.raw_models.items()
+            }
+            # Exact raw names resolve directly, without normalizing the query
+            self._alias_lookup = {**self.models, **self.raw_models}
+            if self.models:
+                self._get = self._alias_lookup.get
+                self._get_normalized = self.models.get
 
-                self.logger.info(f"✅ Loaded {len(self.models)} models from {self.json_path}")
+            if len(self.models) != len(self.raw_models):
+                self.logger.warning(
+                    "⚠️ {} model name(s) collide once normalized.",
+                    len(self.raw_models) - len(self.models)
+                )
+            self.logger.info("✅ Loaded {} models from {}", len(self.models), self.json_path)
         except FileNotFoundError:
-            self.logger.error(f"❌ File not found: {self.json_path}")
-        except json.JSONDecodeError as e:
-            self.logger.error(f"❌ JSON parsing error: {e}")
+            self.logger.error("❌ File not found: {}", self.json_path)
+        except orjson.JSONDecodeError as e:
+            self.logger.error("❌ JSON parsing error: {}", e)
 
     def get_models(self) -> list[str]:
         """Return the list of available model names and log the action."""
         if not self.models:
             self.logger.warning("⚠️ No models loaded.")
             return []
-        self.logger.debug(f"📋 Retrieved list of {len(self.models)} models.")
+        self.logger.debug("📋 Retrieved list of {} models.", len(self.models))
         return list(self.raw_models.keys())
 
     def get_params(self, model_name: str) -> int | None:
         """Return the number of parameters for a given model."""
-        if not self.models:
+        if self._get is None:
             self.logger.warning("⚠️ No models available, cannot retrieve parameters.")
             return None
 
-        normalized_name = self._normalize_key(model_name)
-        params = self.models.get(normalized_name)
+        params = self._get(model_name)
+        if params is None:
+            params = self._get_normalized(_normalize_key(model_name))
 
         if params is None:
-            self.logger.warning(f"⚠️ Model '{model_name}' not found in the list.")
+            self.logger.warning("⚠️ Model '{}' not found in the list.", model_name)
         else:
-            self.logger.debug(f"🔍 {model_name} → {params}B parameters")
+            self.logger.debug("🔍 {} → {}B parameters", model_name, params)
 
         return params
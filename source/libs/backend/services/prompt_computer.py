@@ -1,6 +1,27 @@
 import re
+from functools import lru_cache
 from loggerplusplus import LoggerClass
 
+# Patterns compiled once at import (skips re's internal cache lookup on every call).
+# Greedy \w+ only ever matches whole words, so no \b anchors are needed around it.
+# The stdlib engine is kept on purpose: the pcre2 binding's findall is several
+# times slower here, its per-match overhead outweighs the JIT.
+_WORD_RE = re.compile(r"\w+", flags=re.UNICODE)
+# Same pattern restricted to [A-Za-z0-9_], equivalent on pure-ASCII text
+_WORD_RE_ASCII = re.compile(r"\w+", flags=re.ASCII)
+# One match per non-blank sentence: starts on a visible char, runs up to the next terminator
+_SENTENCE_RE = re.compile(r"[^.!?\s][^.!?]*")
+
+# Keys of the metrics dict, in the order _compute_metrics returns its values
+_METRIC_KEYS = (
+    "word_count",
+    "avg_word_length",
+    "avg_sentence_length",
+    "avg_sentence_length_cubed",
+    "question_marks",
+    "exclamation_marks",
+)
+
 
 class PromptComputer(LoggerClass):
     def __init__(self):
@@ -9,57 +30,75 @@ class PromptComputer(LoggerClass):
     @staticmethod
     def _tokenize_words(text: str) -> list[str]:
         """
-        Tokenize words using word boundaries.
+        Tokenize words (maximal runs of word characters).
         Includes letters, digits, and underscore. Unicode aware.
         """
-        return re.findall(r"\b\w+\b", text, flags=re.UNICODE)
+        # Pure-ASCII prompts (the common case) skip the Unicode word-char tables
+        if text.isascii():
+            return _WORD_RE_ASCII.findall(text)
+        return _WORD_RE.findall(text)
 
     @staticmethod
-    def _split_sentences(text: str) -> list[str]:
+    def _count_sentences(text: str) -> int:
         """
-        Split sentences on ., !, ? (one or more), keep non-empty trimmed pieces.
+        Count sentences split on ., !, ? (one or more), ignoring blank pieces.
         """
-        raw = re.split(r"[.!?]+", text)
-        return [s.strip() for s in raw if s.strip()]
+        return len(_SENTENCE_RE.findall(text))
 
     def compute(self, prompt: str) -> dict[str, int | float]:
         """Compute requested text statistics for the current prompt."""
-        text = prompt
+        # Metrics are memoized per prompt (the same prompt is often scored for
+        # several models/devices), a fresh dict is built so callers may mutate it
+        result = dict(zip(_METRIC_KEYS, _compute_metrics(prompt)))
 
-        words = self._tokenize_words(text)
-        word_count = len(words)
-
-        avg_word_length = (
-            sum(len(w) for w in words) / word_count if word_count else 0.0
+        # Lazy formatting: the message is only rendered if DEBUG is enabled
+        self.logger.debug(
+            "📊 Computed metrics: "
+            "words={word_count}, "
+            "avg_word_len={avg_word_length:.3f}, "
+            "avg_sent_len={avg_sentence_length:.3f}, "
+            "avg_sent_len_cubed={avg_sentence_length_cubed:.3f}, "
+            "?={question_marks}, !={exclamation_marks}",
+            **result
         )
 
-        sentences = self._split_sentences(text)
-        sentence_count = len(sentences)
-        sentence_lengths = [len(self._tokenize_words(s)) for s in sentences]
-        avg_sentence_length = (
-            sum(sentence_lengths) / sentence_count if sentence_count else 0.0
-        )
-        avg_sentence_length_cubed = avg_sentence_length ** 3
+        return result
 
-        question_marks = text.count("?")
-        exclamation_marks = text.count("!")
 
-        result = {
-            "word_count": word_count,
-            "avg_word_length": avg_word_length,
-            "avg_sentence_length": avg_sentence_length,
-            "avg_sentence_length_cubed": avg_sentence_length_cubed,
-            "question_marks": question_marks,
-            "exclamation_marks": exclamation_marks,
-        }
+@lru_cache(maxsize=512)
+def _compute_metrics(text: str) -> tuple[int | float, ...]:
+    """
+    Compute the prompt statistics, as a tuple ordered like _METRIC_KEYS.
 
-        self.logger.debug(
-            "📊 Computed metrics: "
-            f"words={word_count}, "
-            f"avg_word_len={avg_word_length:.3f}, "
-            f"avg_sent_len={avg_sentence_length:.3f}, "
-            f"avg_sent_len_cubed={avg_sentence_length_cubed:.3f}, "
-            f"?={question_marks}, !={exclamation_marks}"
-        )
+    Args:
+        text (str): The prompt to analyse.
 
-        return result
+    Returns:
+        tuple[int | float, ...]: The metric values (immutable, safe to cache).
+    """
+    words = PromptComputer._tokenize_words(text)
+    word_count = len(words)
+
+    avg_word_length = (
+        sum(map(len, words)) / word_count if word_count else 0.0
+    )
+
+    # Terminators are not word characters: every word belongs to exactly one
+    # sentence, so per-sentence word counts always add up to word_count
+    sentence_count = PromptComputer._count_sentences(text)
+    avg_sentence_length = (
+        word_count / sentence_count if sentence_count else 0.0
+    )
+    avg_sentence_length_cubed = avg_sentence_length ** 3
+
+    question_marks = text.count("?")
+    exclamation_marks = text.count("!")
+
+    return (
+        word_count,
+        avg_word_length,
+        avg_sentence_length,
+        avg_sentence_length_cubed,
+        question_marks,
+        exclamation_marks,
+    )
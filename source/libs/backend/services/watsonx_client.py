@@ -4,13 +4,26 @@
 # for all key operations, including token management and prediction requests.
 
 # ====== Standard Library Imports ======
+import asyncio
+import hashlib
+import os
+import random
+import tempfile
+import threading
 import time
 import json
 import logging
+from functools import lru_cache
+from itertools import takewhile
+from pathlib import Path
 
 # ====== Third-Party Library Imports ======
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+import httpx
+import orjson
 
 # ====== Internal Project Imports ======
 # (None)
@@ -46,6 +59,20 @@ class WatsonClient(LoggerClass):
 
     IAM_URL: str = "https://iam.cloud.ibm.com/identity/token"
 
+    # Above the threshold, predict for a 70B baseline and scale by (nb / 70) ** alpha
+    SCALING_THRESHOLD_NB: float = 100.0
+    BASELINE_NB: float = 70.0
+    SCALING_ALPHA: float = 1.1
+
+    # IAM tokens are persisted here (one file per API key) to survive restarts
+    TOKEN_CACHE_DIR: Path = Path.home() / ".cache" / "watsonx"
+
+    # 5xx retries wait FACTOR * 2 ** (n - 1) seconds plus up to JITTER random seconds
+    # (capped at MAX), so clients hit by the same outage do not retry in lockstep
+    RETRY_BACKOFF_FACTOR: float = 1.0
+    RETRY_BACKOFF_JITTER: float = 0.5
+    RETRY_BACKOFF_MAX: float = 10.0
+
     def __init__(
         self,
         api_key: str,
@@ -82,13 +109,63 @@ class WatsonClient(LoggerClass):
         self._token: Optional[str] = None
         self._token_obtained_at: float = 0.0
         self._token_ttl_sec: int = 50 * 60  # refresh after 50 min
+        # Serializes token refreshes, the client being shared across threads
+        self._token_lock = threading.Lock()
+        key_hash = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        self._token_cache_path: Path = self.TOKEN_CACHE_DIR / f"token_{key_hash}.json"
+        self._load_cached_token()
+
+        # Persistent session: keep-alive reuses TCP/TLS connections across calls.
+        # 5xx answers are retried by urllib3 with exponential backoff; once retries
+        # are exhausted the last response is returned (raise_on_status=False).
+        # Only requests that never reached the server (connect errors) are retried
+        # otherwise: a read timeout must not re-send a POST and double the wait.
+        retry = _BackoffRetry(
+            total=None,
+            connect=max_retries,
+            read=0,
+            other=0,
+            status=max_retries,
+            backoff_factor=self.RETRY_BACKOFF_FACTOR,
+            backoff_jitter=self.RETRY_BACKOFF_JITTER,
+            backoff_max=self.RETRY_BACKOFF_MAX,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=("POST",),
+            raise_on_status=False,
+        )
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry),
+        )
+        # Payload field lists, keyed by the (ordered) indicator names
+        self._fields_cache: dict[tuple[str, ...], list[str]] = {}
+        # Async HTTP/2 client for predict_async(), created on first use
+        self._aclient: Optional[httpx.AsyncClient] = None
 
-        self.logger.info("WatsonClient initialized for region=%s deployment_id=%s", region, deployment_id)
+        self.logger.info("WatsonClient initialized for region={} deployment_id={}", region, deployment_id)
 
     # =============================
     # Public API
     # =============================
 
+    @classmethod
+    def get_instance(cls, api_key: str, region: str, deployment_id: str) -> "WatsonClient":
+        """
+        Return the process-wide client for these credentials, created on first call,
+        so that its connection pools and IAM token are shared by every request.
+
+        Args:
+            api_key: IBM Cloud API key.
+            region: IBM Cloud region (e.g. "us-south").
+            deployment_id: WML deployment identifier.
+
+        Returns:
+            WatsonClient: The shared client.
+        """
+        with _INSTANCES_LOCK:
+            return _get_shared_client(api_key, region, deployment_id)
+
     def predict(
             self,
             have_gpu: bool,
@@ -97,42 +174,25 @@ class WatsonClient(LoggerClass):
             indicators: dict[str, Any],
             headers: Optional[dict[str, str]] = None,
     ) -> float:
-        self.logger.debug("Calling predict with device=%s nb_parameters=%s", device, nb_parameters)
-
-        # 2. Decide prediction mode (direct vs. baseline + scaling)
-        use_scaling = nb_parameters > 100.0
-        alpha = 1.1
+        self.logger.debug("Calling predict with device={} nb_parameters={}", device, nb_parameters)
+        payload, ratio = self._build_prediction_payload(have_gpu, device, nb_parameters, indicators)
+        return self._read_prediction(self._send_prediction(payload, headers), ratio)
 
-        if use_scaling:
-            # --- Baseline pass with 70B ---
-            baseline_nb = 70.0
-            fields = ["usable_gpu", "device", "nb_parameters"] + list(indicators.keys())
-            values = [[have_gpu, device, baseline_nb] + list(indicators.values())]
-            payload: dict[str, Any] = {"input_data": [{"fields": fields, "values": values}]}
-
-            self.logger.info(
-                "Submitting baseline prediction (scaling active). fields: %s | alpha=%.3f | target_nb=%.3f",
-                fields, alpha, nb_parameters
-            )
-
-            baseline = self._send_prediction(payload, headers)["predictions"][0]["values"][0][0]
-            ratio = nb_parameters / baseline_nb
-            scaled = float(baseline) * (ratio ** alpha)
-
-            self.logger.debug(
-                "Baseline=%s | ratio=%.4f | alpha=%.3f -> scaled=%s",
-                baseline, ratio, alpha, scaled
-            )
-            return scaled
-
-        else:
-            # --- Direct pass with provided nb_parameters ---
-            fields = ["usable_gpu", "device", "nb_parameters"] + list(indicators.keys())
-            values = [[have_gpu, device, nb_parameters] + list(indicators.values())]
-            payload: dict[str, Any] = {"input_data": [{"fields": fields, "values": values}]}
-
-            self.logger.info("Submitting prediction request with fields: %s", fields)
-            return self._send_prediction(payload, headers)["predictions"][0]["values"][0][0]
+    async def predict_async(
+            self,
+            have_gpu: bool,
+            device: str,
+            nb_parameters: float,
+            indicators: dict[str, Any],
+            headers: Optional[dict[str, str]] = None,
+    ) -> float:
+        """
+        Non-blocking variant of predict(), sent over a shared HTTP/2 client so that
+        concurrent predictions are multiplexed on the same connection.
+        """
+        self.logger.debug("Calling predict_async with device={} nb_parameters={}", device, nb_parameters)
+        payload, ratio = self._build_prediction_payload(have_gpu, device, nb_parameters, indicators)
+        return self._read_prediction(await self._send_prediction_async(payload, headers), ratio)
 
     def predict_raw(
         self,
@@ -152,32 +212,153 @@ class WatsonClient(LoggerClass):
         self.logger.debug("Calling predict_raw with custom payload.")
         return self._send_prediction(payload, headers)
 
+    def invalidate_token(self) -> None:
+        """Forget the current IAM token, in memory and on disk."""
+        with self._token_lock:
+            self._token = None
+            self._token_obtained_at = 0.0
+            self._delete_cached_token()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if it was ever created."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    def __enter__(self) -> "WatsonClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     # =============================
     # Internals
     # =============================
 
+    def _build_prediction_payload(
+        self,
+        have_gpu: bool,
+        device: str,
+        nb_parameters: float,
+        indicators: dict[str, Any],
+    ) -> tuple[dict[str, Any], Optional[float]]:
+        """
+        Build the prediction payload, deciding the prediction mode
+        (direct vs. baseline + scaling).
+
+        Returns:
+            tuple: The payload and the scaling ratio (None for a direct prediction).
+        """
+        use_scaling = nb_parameters > self.SCALING_THRESHOLD_NB
+        model_nb = self.BASELINE_NB if use_scaling else nb_parameters
+
+        # Indicators almost always share the same names: only values are rebuilt per call
+        fields_key = tuple(indicators)
+        fields = self._fields_cache.get(fields_key)
+        if fields is None:
+            fields = self._fields_cache[fields_key] = ["usable_gpu", "device", "nb_parameters", *fields_key]
+        values = [[have_gpu, device, model_nb, *indicators.values()]]
+        payload: dict[str, Any] = {"input_data": [{"fields": fields, "values": values}]}
+
+        if use_scaling:
+            # --- Baseline pass with 70B ---
+            self.logger.info(
+                "Submitting baseline prediction (scaling active). fields: {} | alpha={:.3f} | target_nb={:.3f}",
+                fields, self.SCALING_ALPHA, nb_parameters
+            )
+            return payload, nb_parameters / self.BASELINE_NB
+
+        # --- Direct pass with provided nb_parameters ---
+        self.logger.info("Submitting prediction request with fields: {}", fields)
+        return payload, None
+
+    def _read_prediction(self, result: dict[str, Any], ratio: Optional[float]) -> float:
+        """Extract the predicted value, scaling it from the baseline if needed."""
+        value = result["predictions"][0]["values"][0][0]
+        if ratio is None:
+            return value
+
+        scaled = float(value) * (ratio ** self.SCALING_ALPHA)
+        self.logger.debug(
+            "Baseline={} | ratio={:.4f} | alpha={:.3f} -> scaled={}",
+            value, ratio, self.SCALING_ALPHA, scaled
+        )
+        return scaled
+
     def _send_prediction(
         self,
         payload: dict[str, Any],
         headers: Optional[dict[str, str]] = None
     ) -> dict[str, Any]:
         """
-        Handles sending the prediction request with retries and auth management.
+        Handles sending the prediction request with auth management.
+        Server errors (5xx) are retried by the session's urllib3 Retry policy.
         """
         self._ensure_token_fresh()
-        final_headers = self._auth_headers()
+        token = self._token
+        final_headers = self._auth_headers(token)
         if headers:
             final_headers.update(headers)
 
-        for attempt in range(self.max_retries + 1):
-            self.logger.debug("Attempt %d to send prediction", attempt + 1)
+        resp = self._post_json(self.base_predict_url, payload, final_headers)
+
+        if resp.status_code == 401:
+            self.logger.warning("Unauthorized request. Refreshing token.")
+            self._refresh_after_unauthorized(token)
+            token = self._token
+            final_headers = self._auth_headers(token)
+            if headers:
+                final_headers.update(headers)
             resp = self._post_json(self.base_predict_url, payload, final_headers)
 
+        if 200 <= resp.status_code < 300:
+            self.logger.info("Prediction request successful.")
+            return self._json_or_text(resp)
+
+        if resp.status_code == 403:
+            self.logger.error("Access forbidden (403). Check IAM permissions.")
+            hint = (
+                "Forbidden (403): Your identity is not a member of the deployment space.\n"
+                "- In Deployment Space → Manage → Access control: add your IBMid or Service ID (role: Editor).\n"
+            )
+            raise WatsonMLClientError(resp.status_code, self._json_or_text(resp), hint)
+
+        self.logger.error("Prediction request failed with status {}", resp.status_code)
+        raise WatsonMLClientError(resp.status_code, self._json_or_text(resp))
+
+    async def _send_prediction_async(
+        self,
+        payload: dict[str, Any],
+        headers: Optional[dict[str, str]] = None
+    ) -> dict[str, Any]:
+        """
+        Async counterpart of _send_prediction(), with the same retry and auth management.
+        Token refreshes are rare and stay on the sync session, run in a worker thread.
+        """
+        # Only a stale token costs a worker-thread hop, the fresh check is lock-free
+        if not self._token_is_fresh():
+            await asyncio.to_thread(self._ensure_token_fresh)
+        token = self._token
+        final_headers = self._auth_headers(token)
+        if headers:
+            final_headers.update(headers)
+
+        for attempt in range(self.max_retries + 1):
+            self.logger.debug("Attempt {} to send prediction (async)", attempt + 1)
+            resp = await self._post_json_async(self.base_predict_url, payload, final_headers)
+
             if resp.status_code == 401 and attempt == 0:
                 self.logger.warning("Unauthorized request. Refreshing token.")
-                self._refresh_token(force=True)
-                final_headers = self._auth_headers()
-                resp = self._post_json(self.base_predict_url, payload, final_headers)
+                await asyncio.to_thread(self._refresh_after_unauthorized, token)
+                token = self._token
+                final_headers = self._auth_headers(token)
+                if headers:
+                    final_headers.update(headers)
+                resp = await self._post_json_async(self.base_predict_url, payload, final_headers)
 
             if 200 <= resp.status_code < 300:
                 self.logger.info("Prediction request successful.")
@@ -192,44 +373,90 @@ class WatsonClient(LoggerClass):
                 raise WatsonMLClientError(resp.status_code, self._json_or_text(resp), hint)
 
             if 500 <= resp.status_code < 600 and attempt < self.max_retries:
-                self.logger.warning("Server error %d. Retrying...", resp.status_code)
-                time.sleep(1.5 * (attempt + 1))
+                self.logger.warning("Server error {}. Retrying...", resp.status_code)
+                await asyncio.sleep(self._backoff_delay(attempt + 1))
                 continue
 
-            self.logger.error("Prediction request failed with status %d", resp.status_code)
+            self.logger.error("Prediction request failed with status {}", resp.status_code)
             raise WatsonMLClientError(resp.status_code, self._json_or_text(resp))
 
-    def _auth_headers(self) -> dict[str, str]:
+    def _auth_headers(self, token: Optional[str]) -> dict[str, str]:
         return {
-            "Authorization": f"Bearer {self._token}",
+            "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
 
-    def _json_or_text(self, resp: Response) -> dict[str, Any] | str:
+    def _json_or_text(self, resp: Union[Response, httpx.Response]) -> dict[str, Any] | str:
         try:
-            return resp.json()
-        except ValueError:
+            return orjson.loads(resp.content)
+        except orjson.JSONDecodeError:
             self.logger.warning("Response was not JSON. Returning raw text.")
             return resp.text
 
     def _post_json(self, url: str, payload: dict[str, Any], headers: dict[str, str]) -> Response:
         try:
-            self.logger.debug("Posting JSON to URL: %s", url)
-            return requests.post(url, json=payload, headers=headers, timeout=self.timeout)
+            self.logger.debug("Posting JSON to URL: {}", url)
+            # Pre-serialized with orjson (headers already carry the JSON content type)
+            return self._session.post(url, data=orjson.dumps(payload), headers=headers, timeout=self.timeout)
         except requests.exceptions.ConnectTimeout as e:
-            self.logger.error("Connection timeout: %s", e)
+            self.logger.error("Connection timeout: {}", e)
             raise WatsonMLNetworkError(f"Timeout when connecting to {url}: {e}")
         except requests.RequestException as e:
-            self.logger.error("Request failed: %s", e)
+            self.logger.error("Request failed: {}", e)
+            raise WatsonMLNetworkError(str(e))
+
+    async def _post_json_async(self, url: str, payload: dict[str, Any], headers: dict[str, str]) -> httpx.Response:
+        if self._aclient is None:
+            connect_timeout, read_timeout = self.timeout
+            self._aclient = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20),
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            )
+        try:
+            self.logger.debug("Posting JSON to URL (async): {}", url)
+            return await self._aclient.post(url, content=orjson.dumps(payload), headers=headers)
+        except httpx.ConnectTimeout as e:
+            self.logger.error("Connection timeout: {}", e)
+            raise WatsonMLNetworkError(f"Timeout when connecting to {url}: {e}")
+        except httpx.HTTPError as e:
+            self.logger.error("Request failed: {}", e)
             raise WatsonMLNetworkError(str(e))
 
     def _ensure_token_fresh(self) -> None:
-        now = time.time()
-        if not self._token or (now - self._token_obtained_at) > self._token_ttl_sec:
+        # Double-checked locking: the lock is only taken when a refresh looks needed
+        if self._token_is_fresh():
+            return
+        with self._token_lock:
+            # Another thread may have refreshed the token while we waited
+            if self._token_is_fresh():
+                return
             self.logger.info("Refreshing IAM token...")
             self._refresh_token(force=True)
 
+    def _refresh_after_unauthorized(self, stale_token: Optional[str]) -> None:
+        """
+        Replace the token rejected with a 401, once: concurrent callers rejected with
+        the same token wait on the lock, then reuse the replacement.
+        """
+        with self._token_lock:
+            if self._token != stale_token:
+                return
+            # Replaced in place (never cleared), so concurrent callers keep sending a token
+            self._delete_cached_token()
+            self._refresh_token(force=True)
+
+    @classmethod
+    def _backoff_delay(cls, retry_number: int) -> float:
+        """Exponential backoff with jitter before the given retry (1 for the first one)."""
+        delay = cls.RETRY_BACKOFF_FACTOR * (2 ** (retry_number - 1))
+        delay += random.uniform(0.0, cls.RETRY_BACKOFF_JITTER)
+        return min(cls.RETRY_BACKOFF_MAX, delay)
+
+    def _token_is_fresh(self) -> bool:
+        return bool(self._token) and (time.time() - self._token_obtained_at) <= self._token_ttl_sec
+
     def _refresh_token(self, force: bool = False) -> None:
         if self._token and not force:
             return
@@ -239,13 +466,13 @@ class WatsonClient(LoggerClass):
             "apikey": self.api_key,
         }
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        r = requests.post(self.IAM_URL, data=data, headers=headers, timeout=self.timeout)
+        r = self._session.post(self.IAM_URL, data=data, headers=headers, timeout=self.timeout)
 
         if r.status_code != 200:
-            self.logger.error("Failed to refresh token. Status: %d", r.status_code)
+            self.logger.error("Failed to refresh token. Status: {}", r.status_code)
             raise WatsonMLAuthError(f"IAM token error ({r.status_code}). {r.text}")
 
-        tok = r.json().get("access_token")
+        tok = orjson.loads(r.content).get("access_token")
         if not tok:
             self.logger.error("No access_token found in IAM response.")
             raise WatsonMLAuthError(f"IAM response missing access_token: {r.text}")
@@ -253,6 +480,79 @@ class WatsonClient(LoggerClass):
         self._token = tok
         self._token_obtained_at = time.time()
         self.logger.info("Token refreshed successfully.")
+        self._store_cached_token()
+
+    def _load_cached_token(self) -> None:
+        """Reuse the token persisted by a previous process, if still within its TTL."""
+        try:
+            cached = orjson.loads(self._token_cache_path.read_bytes())
+            token, obtained_at = cached["token"], float(cached["obtained_at"])
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning("Ignoring unreadable cached IAM token: {}", e)
+            return
+
+        if token and (time.time() - obtained_at) < self._token_ttl_sec:
+            self._token = token
+            self._token_obtained_at = obtained_at
+            self.logger.info("Reusing cached IAM token.")
+
+    def _store_cached_token(self) -> None:
+        """Persist the current token (owner-only file, replaced atomically)."""
+        cache_dir = self._token_cache_path.parent
+        tmp_path = None
+        try:
+            cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Unique temp file (mode 0600), so concurrent writers never share one
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f"{self._token_cache_path.name}.", suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps({"token": self._token, "obtained_at": self._token_obtained_at}))
+            os.replace(tmp_path, self._token_cache_path)
+        except OSError as e:
+            # The cache is an optimization only: a read-only home must not break auth
+            self.logger.warning("Could not cache IAM token on disk: {}", e)
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+
+    def _delete_cached_token(self) -> None:
+        try:
+            self._token_cache_path.unlink(missing_ok=True)
+        except OSError as e:
+            self.logger.warning("Could not delete cached IAM token: {}", e)
+
+
+# =============================
+# Retry policy
+# =============================
+
+class _BackoffRetry(Retry):
+    """
+    urllib3 Retry using WatsonClient's backoff. The stock policy does not wait at
+    all after a single error, so the first (and by default only) retry would fire
+    immediately at a server that just answered 5xx.
+    """
+
+    def get_backoff_time(self) -> float:
+        consecutive_errors = len(list(
+            takewhile(lambda h: h.redirect_location is None, reversed(self.history))
+        ))
+        if consecutive_errors == 0:
+            return 0.0
+        return WatsonClient._backoff_delay(consecutive_errors)
+
+
+# =============================
+# Shared instances
+# =============================
+
+_INSTANCES_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _get_shared_client(api_key: str, region: str, deployment_id: str) -> WatsonClient:
+    """Build the client backing WatsonClient.get_instance(), once per credentials."""
+    return WatsonClient(api_key=api_key, region=region, deployment_id=deployment_id)
 
 
 # =============================